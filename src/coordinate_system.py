@@ -1,11 +1,86 @@
 """Coordinate system custom control with graph visualization"""
 
+import math
 import flet as ft
 import flet.canvas as cv
 import numpy as np
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 from graph_state import GraphState, FunctionGraph
 
+# Samples per function curve: full redraws take about one per 2 px of canvas
+# width within [_MIN_SAMPLES, _MAX_SAMPLES]; dragging uses a fixed coarse count
+_MIN_SAMPLES = 200
+_MAX_SAMPLES = 2000
+_DRAG_SAMPLES = 60
+# Seconds to gather pan deltas and wheel ticks before one redraw (about a frame)
+_FRAME_INTERVAL = 1 / 60
+# Smallest on-screen gap between minor grid lines, in pixels
+_MIN_GRID_SPACING = 8
+# Sampled ranges kept per plotted expression, and the range quantum as a
+# fraction of the visible span
+_SAMPLE_CACHE_SIZE = 4
+_SAMPLE_QUANTUM = 0.01
+# Sample arrays only feed pixel positions, so single precision is plenty
+_SAMPLE_DTYPE = np.float32
+# Tick label strings kept for reuse (a few views' worth of both axes)
+_INT_STR_CACHE_SIZE = 512
+# Color palettes for multiple function curves (brighter in dark mode)
+_COLORS_LIGHT = (
+    ft.Colors.RED,
+    ft.Colors.BLUE,
+    ft.Colors.GREEN,
+    ft.Colors.ORANGE,
+    ft.Colors.PURPLE,
+)
+_COLORS_DARK = (
+    ft.Colors.RED_400,
+    ft.Colors.BLUE_400,
+    ft.Colors.GREEN_400,
+    ft.Colors.ORANGE_400,
+    ft.Colors.PURPLE_400,
+)
+
+
+def _grid_step(scale: float) -> int:
+    """Return the minor grid step: the smallest 1/5 x 10^k at least _MIN_GRID_SPACING px apart
+    
+    Major lines sit at twice this step, so at normal zoom (step 1) the grid
+    keeps its 1/2 unit layout and only thins out once lines would crowd.
+    """
+    ratio = _MIN_GRID_SPACING / scale
+    if ratio <= 1:
+        return 1
+    power = 10 ** math.floor(math.log10(ratio))
+    return int(next(m * power for m in (1, 5, 10) if m * power >= ratio))
+
+
+@lru_cache(maxsize=_INT_STR_CACHE_SIZE)
+def _int_str(value: int) -> str:
+    """Return the label text for an integer tick, reusing recent strings"""
+    return str(int(value))
+
+
+def _compute_grid_lines(start: int, stop: int, step: int, origin: float,
+                        scale: float, extent: float, skip_zero: bool = False) -> tuple:
+    """Return the math values and screen positions of the visible lines on one axis
+    
+    Lines sit at start, start + step, ... up to stop and map to
+    ``origin + value * scale`` (pass a negative scale for the y axis). Only
+    positions within 10 px of [0, extent] are generated: the value bounds are
+    derived from those screen bounds up front instead of masking afterwards.
+    """
+    low = (-10 - origin) / scale
+    high = (extent + 10 - origin) / scale
+    if low > high:
+        low, high = high, low
+    first = max(0, math.ceil((low - start) / step))
+    last = min((stop - start) // step, math.floor((high - start) / step))
+    values = start + step * np.arange(first, last + 1)
+    if skip_zero:
+        values = values[values != 0]
+    return values.tolist(), (origin + values * scale).tolist()
+
 
 class CoordinateSystem(ft.Stack):
     """Custom composite control for the coordinate system with graph"""
@@ -15,11 +90,57 @@ class CoordinateSystem(ft.Stack):
         self._page = page
         self.expand = True
         self.state = GraphState()
+        # Cached grid/axes/ticks and function curves, each tagged with the view
+        # state it was built for so unchanged parts are reused across redraws
+        self._static_cache_key = None
+        self._static_shapes = None
+        self._function_cache_key = None
+        self._function_shapes = []
+        # View state of the shapes last pushed to the canvas
+        self._drawn_frame_key = None
+        # Paints and text styles for light (False) and dark (True) mode
+        self._paints = self._build_paints()
+        self._curve_paints: Dict[str, ft.Paint] = {}
+        # Recently sampled (x_vals, y_vals), keyed by expression, sample count
+        # and quantized x range, oldest first
+        self._sample_cache: Dict[tuple, tuple] = {}
+        # Static shape layers ("major_x", "x_axis", ...), each tagged with the
+        # inputs it was built from so a pan along one axis reuses the shapes
+        # that it does not move
+        self._layer_cache: Dict[str, tuple] = {}
+        
+        # Sub-pixel pan deltas not yet applied to the offsets, and the pending
+        # once-per-frame redraw for pan/zoom input (with its drag mode)
+        self._pending_dx = 0.0
+        self._pending_dy = 0.0
+        self._frame_timer = None
+        self._frame_drag_mode = False
         
         # Initialize controls
         self.init()
         self._is_dragging = False
     
+    @staticmethod
+    def _build_paints() -> Dict[bool, Dict[str, object]]:
+        """Build the grid/axis paints and label styles for both color modes"""
+        paints = {}
+        for dark_mode, grid, minor_grid, ink in (
+            (False, ft.Colors.GREY_400, ft.Colors.GREY_300, ft.Colors.BLACK),
+            (True, ft.Colors.GREY_600, ft.Colors.GREY_500, ft.Colors.WHITE),
+        ):
+            paints[dark_mode] = {
+                "grid": ft.Paint(color=grid, stroke_width=1.5,
+                                 style=ft.PaintingStyle.STROKE),
+                "minor_grid": ft.Paint(color=minor_grid, stroke_width=1.2,
+                                       style=ft.PaintingStyle.STROKE),
+                "axis": ft.Paint(color=ink, stroke_width=2),
+                "arrow": ft.Paint(color=ink, stroke_width=2, style=ft.PaintingStyle.FILL),
+                "tick": ft.Paint(color=ink, stroke_width=1, style=ft.PaintingStyle.STROKE),
+                "axis_label": ft.TextStyle(size=12, weight=ft.FontWeight.BOLD, color=ink),
+                "tick_label": ft.TextStyle(size=10, color=ink),
+            }
+        return paints
+    
     def init(self):
         """Initialize the coordinate system"""
         # Create canvas
@@ -47,9 +168,6 @@ class CoordinateSystem(ft.Stack):
         self.controls = [
             gesture_detector,
         ]
-        
-        # Draw initial graph after layout (defer using a timer)
-        self._first_draw = True
     
     def did_mount(self):
         """Called when control is mounted to the page"""
@@ -58,34 +176,71 @@ class CoordinateSystem(ft.Stack):
     
     def to_screen(self, x: float, y: float) -> tuple:
         """Convert mathematical coordinates to screen coordinates"""
+        cx, cy = self._screen_origin()
+        scale = self.state.scale
+        return cx + x * scale, cy - y * scale
+    
+    def _screen_origin(self) -> tuple:
+        """Return the screen position of the math origin"""
         # Use page dimensions for centering (not canvas dimensions)
-        page_width = self._page.width if self._page.width else self._page.window.width
-        page_height = self._page.height if self._page.height else self._page.window.height
-        sx = (page_width / 2) + self.state.offset_x + (x * self.state.scale)
-        sy = (page_height / 2) + self.state.offset_y - (y * self.state.scale)
-        return sx, sy
+        page = self._page
+        page_width = page.width or page.window.width
+        page_height = page.height or page.window.height
+        state = self.state
+        return page_width / 2 + state.offset_x, page_height / 2 + state.offset_y
     
     def _handle_pan_start(self, e: ft.DragStartEvent):
         """Handle pan start - mark as dragging"""
         self._is_dragging = True
     
     def _handle_pan_update(self, e: ft.DragUpdateEvent):
-        """Handle pan (drag) updates - fast update without function curve"""
-        self.state.offset_x += e.local_delta.x
-        self.state.offset_y += e.local_delta.y
-        # During dragging, skip expensive function curve drawing for responsiveness
-        self.redraw(skip_function=True)
+        """Handle pan (drag) updates - fast update with a coarse function curve"""
+        # Gather sub-pixel moves until they add up to a visible change
+        self._pending_dx += e.local_delta.x
+        self._pending_dy += e.local_delta.y
+        if abs(self._pending_dx) < 1 and abs(self._pending_dy) < 1:
+            return
+        self._apply_pending_pan()
+        # During dragging, draw the curves with fewer samples for responsiveness
+        self._request_frame(drag_mode=True)
     
     def _handle_pan_end(self, e: ft.DragEndEvent):
         """Handle pan end - do full redraw with function"""
         self._is_dragging = False
-        self.redraw(skip_function=False)
+        self._apply_pending_pan()
+        # The full redraw supersedes any coarse frame still waiting
+        if self._frame_timer is not None:
+            self._frame_timer.cancel()
+            self._frame_timer = None
+        self.redraw(drag_mode=False)
+    
+    def _apply_pending_pan(self):
+        """Move the view by the pan deltas gathered so far"""
+        self.state.offset_x += self._pending_dx
+        self.state.offset_y += self._pending_dy
+        self._pending_dx = self._pending_dy = 0.0
     
     def _handle_scroll(self, e: ft.ScrollEvent):
-        """Handle scroll for zoom"""
+        """Handle scroll for zoom - wheel ticks within a frame share one redraw"""
         zoom_factor = 1.1 if e.scroll_delta_y < 0 else 0.9
         self.state.scale *= zoom_factor
-        self.redraw()
+        self._request_frame(drag_mode=False)
+    
+    def _request_frame(self, drag_mode: bool):
+        """Schedule one redraw for the next frame, however many events arrive first"""
+        if self._frame_timer is None:
+            self._frame_drag_mode = drag_mode
+            self._frame_timer = self._page.loop.call_later(
+                _FRAME_INTERVAL, self._flush_frame
+            )
+        else:
+            # A full-quality request in the same frame wins over a coarse one
+            self._frame_drag_mode = self._frame_drag_mode and drag_mode
+    
+    def _flush_frame(self):
+        """Redraw once for the input gathered since the frame was requested"""
+        self._frame_timer = None
+        self.redraw(drag_mode=self._frame_drag_mode)
     
     def pan_up(self):
         """Pan view upward"""
@@ -126,60 +281,112 @@ class CoordinateSystem(ft.Stack):
     
     def set_expression(self, expr: str):
         """Set the function expression to display"""
+        FunctionGraph.compile_expression(expr)  # Compile once up front, not on first redraw
         self.state.expr = expr
         self.redraw()
     
-    def redraw(self, skip_function: bool = False):
+    def redraw(self, drag_mode: bool = False):
         """Redraw the entire canvas
         
         Args:
-            skip_function: If True, skip drawing the function curve for faster updates during panning
+            drag_mode: If True, sample the function curves coarsely for faster updates during panning
         """
-        if self.canvas:
-            try:
-                self.canvas.shapes = self._draw_graph(skip_function=skip_function)
-                self.canvas.update()
-            except Exception as e:
-                # Control may not be fully added yet
-                if self._first_draw:
-                    self._first_draw = False
-                else:
-                    print(f"Redraw error: {e}")
-    
-    def _draw_graph(self, skip_function: bool = False) -> List:
+        # Nothing to draw until the canvas is on the page; did_mount redraws then
+        if self.canvas is None or not self._is_mounted():
+            return
+        # Skip the rebuild and the canvas patch when nothing drawn has changed
+        state = self.state
+        window = self._page.window
+        frame_key = (self._screen_origin(), state.scale, window.width, window.height,
+                     state.dark_mode, state.show_minor_grid, tuple(state.expressions),
+                     drag_mode)
+        if frame_key == self._drawn_frame_key:
+            return
+        self.canvas.shapes = self._draw_graph(drag_mode=drag_mode)
+        self.canvas.update()
+        self._drawn_frame_key = frame_key
+    
+    def _is_mounted(self) -> bool:
+        """Return True once the canvas has been added to a page"""
+        parent = self.canvas
+        while parent is not None:
+            if isinstance(parent, ft.Page):
+                return True
+            parent = parent.parent
+        return False
+    
+    def _draw_graph(self, drag_mode: bool = False) -> List:
         """Draw the complete graph with axes, grid, and function
         
+        The grid/axes/ticks and the function curves are cached separately and
+        each is only rebuilt when the view state it depends on changes.
+        
         Args:
-            skip_function: If True, skip drawing the function curve for faster updates
+            drag_mode: If True, sample the function curves coarsely for faster updates
         """
-        canvas_width = self._page.window.width
-        canvas_height = self._page.window.height
-        shapes = []
+        # Read the window and view state once; the builders work from these
+        window = self._page.window
+        canvas_width = window.width
+        canvas_height = window.height
+        state = self.state
+        # The screen position of the origin covers both the offsets and page size
+        origin = self._screen_origin()
+        view_key = (origin, state.scale, canvas_width, canvas_height, state.dark_mode)
         
-        # Draw grid lines
-        # Set colors based on dark mode
-        if self.state.dark_mode:
-            grid_pen = ft.Paint(color=ft.Colors.GREY_600, stroke_width=1.5)
-            minor_grid_pen = ft.Paint(color=ft.Colors.GREY_500, stroke_width=1.2)
-            axis_pen_color = ft.Colors.WHITE
-            tick_pen_color = ft.Colors.WHITE
-            text_color = ft.Colors.WHITE
-            background_color = ft.Colors.BLACK
+        static_key = view_key + (state.show_minor_grid,)
+        if static_key != self._static_cache_key:
+            self._static_shapes = self._build_static_shapes(canvas_width, canvas_height, origin)
+            self._static_cache_key = static_key
+        
+        # Draw the function curves (coarsely during fast panning for responsiveness)
+        if drag_mode:
+            n_samples = _DRAG_SAMPLES
         else:
-            grid_pen = ft.Paint(color=ft.Colors.GREY_400, stroke_width=1.5)
-            minor_grid_pen = ft.Paint(color=ft.Colors.GREY_300, stroke_width=1.2)
-            axis_pen_color = ft.Colors.BLACK
-            tick_pen_color = ft.Colors.BLACK
-            text_color = ft.Colors.BLACK
-            background_color = ft.Colors.WHITE
+            n_samples = int(np.clip(canvas_width // 2, _MIN_SAMPLES, _MAX_SAMPLES))
+        function_key = view_key + (tuple(state.expressions), n_samples)
+        if function_key != self._function_cache_key:
+            self._function_shapes = self._build_function_shapes(canvas_width, canvas_height,
+                                                                origin, n_samples)
+            self._function_cache_key = function_key
         
-        # Calculate visible range in math coordinates
+        return self._static_shapes + self._function_shapes
+    
+    def _visible_range(self, canvas_width: float, canvas_height: float) -> tuple:
+        """Return the visible (x_min, x_max, y_min, y_max) in math coordinates"""
+        scale = self.state.scale
+        offset_x = self.state.offset_x
+        offset_y = self.state.offset_y
         # When offset_x > 0, we're panning right, so we see more negative x values
-        visible_x_min = -(canvas_width / 2 + self.state.offset_x) / self.state.scale
-        visible_x_max = (canvas_width / 2 - self.state.offset_x) / self.state.scale
+        visible_x_min = -(canvas_width / 2 + offset_x) / scale
+        visible_x_max = (canvas_width / 2 - offset_x) / scale
         # When offset_y > 0, we're panning down, so we see smaller y values (more negative)
-        visible_y_min = -(canvas_height / 2 - self.state.offset_y) / self.state.scale
-        visible_y_max = (canvas_height / 2 + self.state.offset_y) / self.state.scale
+        visible_y_min = -(canvas_height / 2 - offset_y) / scale
+        visible_y_max = (canvas_height / 2 + offset_y) / scale
+        return visible_x_min, visible_x_max, visible_y_min, visible_y_max
+    
+    def _build_static_shapes(self, canvas_width: float, canvas_height: float,
+                             origin: tuple) -> List:
+        """Build the grid, axes, arrows, ticks and labels
+        
+        Layers that only depend on one screen coordinate of the origin (the
+        grid lines along an axis, each axis with its arrow and label) are
+        cached, and the same shape objects are returned while their inputs
+        are unchanged, so Flet sends no patch for them on a pan along the other axis.
+        """
+        shapes = []
+        
+        # Draw grid lines
+        # Pick the pre-built paints for the current color mode
+        dark_mode = self.state.dark_mode
+        paints = self._paints[dark_mode]
+        grid_pen = paints["grid"]
+        minor_grid_pen = paints["minor_grid"]
+        axis_label_style = paints["axis_label"]
+        tick_label_style = paints["tick_label"]
+        
+        # Calculate visible range in math coordinates
+        visible_x_min, visible_x_max, visible_y_min, visible_y_max = \
+            self._visible_range(canvas_width, canvas_height)
         
         # Add padding to avoid edge artifacts
         x_min = int(np.floor(visible_x_min)) - 1
@@ -187,186 +394,247 @@ class CoordinateSystem(ft.Stack):
         y_min = int(np.floor(visible_y_min)) - 1
         y_max = int(np.ceil(visible_y_max)) + 1
         
-        # Major grid lines (every 2 units) - always on whole numbers
-        # Ensure we start from an even number for major grid lines
-        x_min_major = x_min if x_min % 2 == 0 else x_min + 1
-        y_min_major = y_min if y_min % 2 == 0 else y_min + 1
+        # Grid step follows the zoom: every 1 (minor) / 2 (major) units at
+        # normal zoom, coarser once lines would be closer than a few pixels
+        cx, cy = origin
+        sc = self.state.scale
+        minor_step = _grid_step(sc)
+        major_step = 2 * minor_step
         
-        for x in np.arange(x_min_major, x_max + 1, 2):
-            sx, _ = self.to_screen(x, 0)
-            if -10 <= sx <= canvas_width + 10:
-                shapes.append(cv.Line(sx, 0, sx, canvas_height, grid_pen))
+        # Major grid lines - always on whole multiples of the major step
+        x_min_major = -(-x_min // major_step) * major_step
+        y_min_major = -(-y_min // major_step) * major_step
         
-        for y in np.arange(y_min_major, y_max + 1, 2):
-            _, sy = self.to_screen(0, y)
-            if -10 <= sy <= canvas_height + 10:
-                shapes.append(cv.Line(0, sy, canvas_width, sy, grid_pen))
+        # Grid positions are computed as whole arrays; the visible lines of
+        # each layer are packed into a single cv.Path of MoveTo/LineTo pairs
+        shapes += self._cached_layer(
+            "major_x", (x_min_major, x_max, major_step, cx, sc, canvas_width, canvas_height,
+                        dark_mode),
+            lambda: self._grid_path(True, x_min_major, x_max, major_step, cx, sc,
+                                    canvas_width, canvas_height, grid_pen))
+        shapes += self._cached_layer(
+            "major_y", (y_min_major, y_max, major_step, cy, sc, canvas_width, canvas_height,
+                        dark_mode),
+            lambda: self._grid_path(False, y_min_major, y_max, major_step, cy, -sc,
+                                    canvas_height, canvas_width, grid_pen))
         
-        # Minor grid lines (every 1 unit) - only if enabled
+        # Minor grid lines (halfway between major lines) - only if enabled
         if self.state.show_minor_grid:
-            for x in np.arange(x_min, x_max + 1, 1):
-                if x % 2 != 0:  # Skip even numbers (already drawn as major grid)
-                    sx, _ = self.to_screen(x, 0)
-                    if -10 <= sx <= canvas_width + 10:
-                        shapes.append(cv.Line(sx, 0, sx, canvas_height, minor_grid_pen))
-            
-            for y in np.arange(y_min, y_max + 1, 1):
-                if y % 2 != 0:  # Skip even numbers (already drawn as major grid)
-                    _, sy = self.to_screen(0, y)
-                    if -10 <= sy <= canvas_height + 10:
-                        shapes.append(cv.Line(0, sy, canvas_width, sy, minor_grid_pen))
-        
-        # Draw axes
-        axis_pen = ft.Paint(color=axis_pen_color, stroke_width=2)
-        cx, cy = self.to_screen(0, 0)
-        
-        # X-axis
-        shapes.append(cv.Line(0, cy, canvas_width, cy, axis_pen))
-        # Y-axis
-        shapes.append(cv.Line(cx, 0, cx, canvas_height, axis_pen))
-        
-        # Draw axis arrows (at canvas edges, so they move with the axes)
+            # Step over odd multiples only (even ones are already drawn as major grid)
+            x_min_minor = x_min_major - minor_step
+            y_min_minor = y_min_major - minor_step
+            shapes += self._cached_layer(
+                "minor_x", (x_min_minor, x_max, major_step, cx, sc, canvas_width, canvas_height,
+                            dark_mode),
+                lambda: self._grid_path(True, x_min_minor, x_max, major_step, cx, sc,
+                                        canvas_width, canvas_height, minor_grid_pen))
+            shapes += self._cached_layer(
+                "minor_y", (y_min_minor, y_max, major_step, cy, sc, canvas_width, canvas_height,
+                            dark_mode),
+                lambda: self._grid_path(False, y_min_minor, y_max, major_step, cy, -sc,
+                                        canvas_height, canvas_width, minor_grid_pen))
+        
+        # Draw axes, with their arrows (at canvas edges, so they move with the
+        # axes) and labels
+        axis_pen = paints["axis"]
         arrow_size = 10
-        arrow_paint = ft.Paint(color=axis_pen_color, stroke_width=2, 
-                              style=ft.PaintingStyle.FILL)
-        
-        # X-axis arrow (at right edge of canvas)
-        x_arrow_x = canvas_width - 10
-        x_arrow_y = cy
-        shapes.append(cv.Path(
-            [
-                cv.Path.MoveTo(x_arrow_x - arrow_size, x_arrow_y - arrow_size // 2),
-                cv.Path.LineTo(x_arrow_x, x_arrow_y),
-                cv.Path.LineTo(x_arrow_x - arrow_size, x_arrow_y + arrow_size // 2),
-            ],
-            arrow_paint
-        ))
+        arrow_paint = paints["arrow"]
         
-        # Y-axis arrow (at top edge of canvas)
-        y_arrow_x = cx
-        y_arrow_y = 2  # Even higher, closer to the top
-        shapes.append(cv.Path(
-            [
-                cv.Path.MoveTo(y_arrow_x - arrow_size // 2, y_arrow_y + arrow_size),
-                cv.Path.LineTo(y_arrow_x, y_arrow_y),
-                cv.Path.LineTo(y_arrow_x + arrow_size // 2, y_arrow_y + arrow_size),
-            ],
-            arrow_paint
-        ))
+        def x_axis() -> List:
+            # X-axis, with its arrow at the right edge of the canvas
+            x_arrow_x = canvas_width - 10
+            x_arrow_y = cy
+            return [
+                cv.Line(0, cy, canvas_width, cy, axis_pen),
+                cv.Path(
+                    [
+                        cv.Path.MoveTo(x_arrow_x - arrow_size, x_arrow_y - arrow_size // 2),
+                        cv.Path.LineTo(x_arrow_x, x_arrow_y),
+                        cv.Path.LineTo(x_arrow_x - arrow_size, x_arrow_y + arrow_size // 2),
+                    ],
+                    arrow_paint
+                ),
+                cv.Text(x_arrow_x - arrow_size - 15, x_arrow_y - 15, "x", axis_label_style),
+            ]
         
-        # Draw axis labels
-        shapes.append(cv.Text(
-            x_arrow_x - arrow_size - 15, x_arrow_y - 15, "x",
-            ft.TextStyle(size=12, weight=ft.FontWeight.BOLD, color=text_color)
-        ))
-        shapes.append(cv.Text(
-            y_arrow_x + 5, y_arrow_y - 10, "y",
-            ft.TextStyle(size=12, weight=ft.FontWeight.BOLD, color=text_color)
-        ))
+        def y_axis() -> List:
+            # Y-axis, with its arrow at the top edge of the canvas
+            y_arrow_x = cx
+            y_arrow_y = 2  # Even higher, closer to the top
+            return [
+                cv.Line(cx, 0, cx, canvas_height, axis_pen),
+                cv.Path(
+                    [
+                        cv.Path.MoveTo(y_arrow_x - arrow_size // 2, y_arrow_y + arrow_size),
+                        cv.Path.LineTo(y_arrow_x, y_arrow_y),
+                        cv.Path.LineTo(y_arrow_x + arrow_size // 2, y_arrow_y + arrow_size),
+                    ],
+                    arrow_paint
+                ),
+                cv.Text(y_arrow_x + 5, y_arrow_y - 10, "y", axis_label_style),
+            ]
+        
+        shapes += self._cached_layer("x_axis", (cy, canvas_width, dark_mode), x_axis)
+        shapes += self._cached_layer("y_axis", (cx, canvas_height, dark_mode), y_axis)
         shapes.append(cv.Text(
-            cx - 10, cy + 10, "0",
-            ft.TextStyle(size=10, color=text_color)
+            cx - 10, cy + 10, "0", tick_label_style
         ))
         
         # Draw tick marks and labels
-        tick_paint = ft.Paint(color=tick_pen_color, stroke_width=1)
+        tick_paint = paints["tick"]
         
         # Calculate dynamic label interval based on zoom level
         # At scale=50, use interval=2. At scale=5, use interval=20. Etc.
-        # Label interval should be approximately 80-100 pixels apart on screen
+        # Label interval is the smallest 1/2/5 x 10^k step at least 80 pixels
+        # apart on screen, and never below 2 so labels sit on major grid lines
         target_label_spacing = 80  # pixels
-        label_interval = 2
-        while (label_interval * self.state.scale) < target_label_spacing:
-            # If labels are too close, increase interval
-            if label_interval == 2:
-                label_interval = 5
-            elif label_interval == 5:
-                label_interval = 10
-            else:
-                label_interval += 10
+        ratio = target_label_spacing / sc
+        power = 10 ** math.floor(math.log10(max(ratio, 1e-9)))
+        label_interval = next(m * power for m in (1, 2, 5, 10) if m * power >= ratio)
+        label_interval = max(2, int(label_interval))
         
         # X-axis ticks and labels - ensure alignment with grid lines
         x_min = int(np.floor(visible_x_min / label_interval) * label_interval)
         x_max = int(np.ceil(visible_x_max / label_interval) * label_interval)
         
-        for x in np.arange(x_min, x_max + 1, label_interval):
-            if x != 0:
-                sx, sy = self.to_screen(x, 0)
-                if -10 <= sx <= canvas_width + 10:
-                    shapes.append(cv.Line(sx, cy - 5, sx, cy + 5, tick_paint))
-                    shapes.append(cv.Text(
-                        sx - 5, cy + 10, str(int(x)),
-                        ft.TextStyle(size=10, color=text_color)
-                    ))
+        # Tick marks for both axes share one path; labels stay separate texts
+        tick_elements = []
+        xs, sxs = _compute_grid_lines(x_min, x_max, label_interval, cx, sc, canvas_width,
+                                      skip_zero=True)
+        for x, sx in zip(xs, sxs):
+            tick_elements += (cv.Path.MoveTo(sx, cy - 5), cv.Path.LineTo(sx, cy + 5))
+            shapes.append(cv.Text(sx - 5, cy + 10, _int_str(x), tick_label_style))
         
         # Y-axis ticks and labels - ensure alignment with grid lines
         y_min = int(np.floor(visible_y_min / label_interval) * label_interval)
         y_max = int(np.ceil(visible_y_max / label_interval) * label_interval)
         
-        for y in np.arange(y_min, y_max + 1, label_interval):
-            if y != 0:
-                sx, sy = self.to_screen(0, y)
-                if -10 <= sy <= canvas_height + 10:
-                    shapes.append(cv.Line(cx - 5, sy, cx + 5, sy, tick_paint))
-                    shapes.append(cv.Text(
-                        cx - 20, sy + 5, str(int(y)),
-                        ft.TextStyle(size=10, color=text_color)
-                    ))
-        
-        # Draw the function curves (skip during fast panning for responsiveness)
-        if not skip_function:
-            self._draw_functions(shapes, visible_x_min, visible_x_max, 
-                                canvas_width, canvas_height)
+        ys, sys_ = _compute_grid_lines(y_min, y_max, label_interval, cy, -sc, canvas_height,
+                                       skip_zero=True)
+        for y, sy in zip(ys, sys_):
+            tick_elements += (cv.Path.MoveTo(cx - 5, sy), cv.Path.LineTo(cx + 5, sy))
+            shapes.append(cv.Text(cx - 20, sy + 5, _int_str(y), tick_label_style))
+        
+        if tick_elements:
+            shapes.append(cv.Path(tick_elements, tick_paint))
         
         return shapes
     
+    def _cached_layer(self, layer: str, key: tuple, build: Callable[[], List]) -> List:
+        """Return the shapes of a static layer, rebuilding them only when key changes"""
+        cached = self._layer_cache.get(layer)
+        if cached is None or cached[0] != key:
+            cached = self._layer_cache[layer] = (key, build())
+        return cached[1]
+    
+    @staticmethod
+    def _grid_path(vertical: bool, start: int, stop: int, step: int, origin: float,
+                   scale: float, extent: float, length: float, pen: ft.Paint) -> List:
+        """Build one cv.Path holding the grid lines on one axis"""
+        _, positions = _compute_grid_lines(start, stop, step, origin, scale, extent)
+        elements = []
+        if vertical:
+            for sx in positions:
+                elements += (cv.Path.MoveTo(sx, 0), cv.Path.LineTo(sx, length))
+        else:
+            for sy in positions:
+                elements += (cv.Path.MoveTo(0, sy), cv.Path.LineTo(length, sy))
+        return [cv.Path(elements, pen)] if elements else []
+    
+    def _build_function_shapes(self, canvas_width: float, canvas_height: float,
+                               origin: tuple, n_samples: int = _MIN_SAMPLES) -> List:
+        """Build the curves for all plotted expressions"""
+        shapes = []
+        visible_x_min, visible_x_max, visible_y_min, visible_y_max = \
+            self._visible_range(canvas_width, canvas_height)
+        self._draw_functions(shapes, visible_x_min, visible_x_max, 
+                            canvas_width, canvas_height, origin, n_samples,
+                            (visible_y_min, visible_y_max))
+        return shapes
+    
     def _draw_functions(self, shapes: List, x_min: float, x_max: float, 
-                       canvas_width: float, canvas_height: float):
+                       canvas_width: float, canvas_height: float,
+                       origin: tuple, n_samples: int = _MIN_SAMPLES,
+                       y_range: Optional[tuple] = None):
         """Draw all function curves"""
         # Color palette for multiple functions
         # Use brighter colors in dark mode
-        if self.state.dark_mode:
-            colors = [
-                ft.Colors.RED_400,
-                ft.Colors.BLUE_400,
-                ft.Colors.GREEN_400,
-                ft.Colors.ORANGE_400,
-                ft.Colors.PURPLE_400,
-            ]
-        else:
-            colors = [
-                ft.Colors.RED,
-                ft.Colors.BLUE,
-                ft.Colors.GREEN,
-                ft.Colors.ORANGE,
-                ft.Colors.PURPLE,
-            ]
+        colors = _COLORS_DARK if self.state.dark_mode else _COLORS_LIGHT
         
         # Draw each expression
         for i, expr in enumerate(self.state.expressions):
             color = colors[i % len(colors)]
             self._draw_function(shapes, expr, x_min, x_max, 
-                              canvas_width, canvas_height, color)
+                              canvas_width, canvas_height, origin, color, n_samples,
+                              y_range)
+    
+    def _sample(self, expr: str, x_min: float, x_max: float, n_samples: int) -> tuple:
+        """Return (x_vals, y_vals) covering [x_min, x_max], reusing recent samples
+        
+        The range is widened outward to whole quanta (1% of the span), so small
+        pans keep hitting the same entry instead of re-evaluating expr.
+        """
+        quantum = (x_max - x_min) * _SAMPLE_QUANTUM
+        if quantum <= 0:
+            quantum = 1.0
+        lo = int(np.floor(x_min / quantum))
+        hi = int(np.ceil(x_max / quantum))
+        key = (expr, n_samples, quantum, lo, hi)
+        cached = self._sample_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        x_vals = np.linspace(lo * quantum, hi * quantum, n_samples, dtype=_SAMPLE_DTYPE)
+        y_vals = FunctionGraph.evaluate(expr, x_vals)
+        
+        self._sample_cache[key] = (x_vals, y_vals)
+        limit = _SAMPLE_CACHE_SIZE * max(1, len(self.state.expressions))
+        while len(self._sample_cache) > limit:
+            del self._sample_cache[next(iter(self._sample_cache))]
+        return x_vals, y_vals
     
     def _draw_function(self, shapes: List, expr: str, x_min: float, x_max: float, 
-                      canvas_width: float, canvas_height: float, 
-                      color: str = ft.Colors.RED):
-        """Draw a single function curve"""
+                      canvas_width: float, canvas_height: float, origin: tuple,
+                      color: str = ft.Colors.RED, n_samples: int = _MIN_SAMPLES,
+                      y_range: Optional[tuple] = None):
+        """Draw a single function curve
+        
+        If y_range is given, samples more than 2 units outside it are dropped,
+        keeping the first one on either side of each visible run, and both ends
+        of a segment crossing the whole range, so segments still reach the
+        canvas edge.
+        """
         try:
-            curve_paint = ft.Paint(
-                color=color,
-                stroke_width=3,
-                style=ft.PaintingStyle.STROKE
-            )
+            curve_paint = self._curve_paints.get(color)
+            if curve_paint is None:
+                curve_paint = ft.Paint(
+                    color=color,
+                    stroke_width=3,
+                    style=ft.PaintingStyle.STROKE
+                )
+                self._curve_paints[color] = curve_paint
             
             # Sample points
-            x_vals = np.linspace(x_min, x_max, 400)
-            y_vals = FunctionGraph.evaluate(expr, x_vals)
+            x_vals, y_vals = self._sample(expr, x_min, x_max, n_samples)
+            
+            # Transform the whole sample array to screen space at once
+            sxs, sys_ = FunctionGraph.project(x_vals, y_vals, *origin, self.state.scale)
+            
+            valid = np.isfinite(sys_)
+            if y_range is not None:
+                above = y_vals > y_range[1] + 2
+                below = y_vals < y_range[0] - 2
+                in_view = valid & ~above & ~below
+                # A steep segment can jump across the whole view between two
+                # samples; keep both ends so it is still drawn
+                crossing = (above[:-1] & below[1:]) | (below[:-1] & above[1:])
+                near_view = in_view.copy()
+                near_view[1:] |= in_view[:-1] | crossing
+                near_view[:-1] |= in_view[1:] | crossing
+                valid &= near_view
             
             # Create and add path
-            path_elements = FunctionGraph.create_path(
-                x_vals, y_vals, self.to_screen
-            )
+            path_elements = FunctionGraph.create_path_from_screen(sxs, sys_, valid)
             
             if path_elements:
                 shapes.append(cv.Path(path_elements, curve_paint))
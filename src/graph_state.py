@@ -1,12 +1,150 @@
 """Data models and utility classes for the graphing application"""
 
+import ast
 import numpy as np
 import flet.canvas as cv
 from dataclasses import dataclass, field
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 
 
-@dataclass
+# Names available to plotted expressions, whether evaluated over the whole
+# array or point by point: the whole numpy module plus bare aliases for
+# common functions, so both "np.sin(x)" and "sin(x)" work
+KERNEL_GLOBALS = {
+    "np": np,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "exp": np.exp,
+    "log": np.log,
+    "sqrt": np.sqrt,
+    "abs": np.abs,
+    "pi": np.pi,
+    "__builtins__": {},
+}
+
+
+# Errors raised while parsing or compiling user input: malformed source,
+# null bytes, and nesting too deep for the parser or the recursive walkers
+_PARSE_ERRORS = (SyntaxError, ValueError, RecursionError, MemoryError)
+
+
+def _result_dtype(x_vals: np.ndarray) -> np.dtype:
+    """Return the float dtype results should have: that of x_vals if it is a float array"""
+    return x_vals.dtype if x_vals.dtype.kind == "f" else np.dtype(float)
+
+
+def _lambdify(expr: str) -> Callable:
+    """Turn an expression string into a ``lambda x: <expr>`` function
+    
+    Calling the function binds x as a fast local, unlike eval() with a fresh
+    locals dict on every call. Raises one of _PARSE_ERRORS for malformed input.
+    """
+    args = ast.arguments(posonlyargs=[], args=[ast.arg(arg="x")], kwonlyargs=[],
+                         kw_defaults=[], defaults=[])
+    tree = ast.Expression(ast.Lambda(args=args, body=ast.parse(expr, mode="eval").body))
+    ast.fix_missing_locations(tree)
+    return eval(compile(tree, "<graph>", "eval"), KERNEL_GLOBALS)
+
+
+# Polynomials up to this degree get a Horner kernel; higher powers stay on eval
+_MAX_POLY_DEGREE = 16
+
+
+def _poly_mul(a: List[float], b: List[float]) -> Optional[List[float]]:
+    """Multiply two ascending coefficient lists, or None past _MAX_POLY_DEGREE"""
+    if len(a) + len(b) - 2 > _MAX_POLY_DEGREE:
+        return None
+    result = [0.0] * (len(a) + len(b) - 1)
+    for i, ca in enumerate(a):
+        for j, cb in enumerate(b):
+            result[i + j] += ca * cb
+    return result
+
+
+def _is_monomial(coeffs: List[float]) -> bool:
+    """Return True if coeffs has at most one nonzero term"""
+    return sum(1 for c in coeffs if c) <= 1
+
+
+def _poly_coeffs(node: ast.AST) -> Optional[List[float]]:
+    """Return the ascending coefficients of node as a sum of monomials in x, or None
+    
+    Products and powers of sums such as ``(x - 5)**10`` are not expanded: their
+    coefficients are large and alternating, and Horner's rule over them loses
+    the result to cancellation, so they stay on direct evaluation.
+    """
+    if isinstance(node, ast.Constant):
+        if type(node.value) not in (int, float):
+            return None
+        try:
+            return [float(node.value)]
+        except OverflowError:
+            return None
+    if isinstance(node, ast.Name):
+        if node.id == "x":
+            return [0.0, 1.0]
+        return [np.pi] if node.id == "pi" else None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        operand = _poly_coeffs(node.operand)
+        if operand is None or isinstance(node.op, ast.UAdd):
+            return operand
+        return [-c for c in operand]
+    if not isinstance(node, ast.BinOp):
+        return None
+    left = _poly_coeffs(node.left)
+    if left is None:
+        return None
+    if isinstance(node.op, ast.Pow):
+        # Only literal non-negative integer exponents keep it a polynomial
+        power = node.right
+        if not (isinstance(power, ast.Constant) and type(power.value) is int
+                and 0 <= power.value <= _MAX_POLY_DEGREE and _is_monomial(left)):
+            return None
+        result = [1.0]
+        for _ in range(power.value):
+            result = _poly_mul(result, left)
+            if result is None:
+                return None
+        return result
+    right = _poly_coeffs(node.right)
+    if right is None:
+        return None
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        sign = 1.0 if isinstance(node.op, ast.Add) else -1.0
+        result = left + [0.0] * (len(right) - len(left))
+        for i, c in enumerate(right):
+            result[i] += sign * c
+        return result
+    if isinstance(node.op, ast.Mult) and (_is_monomial(left) or _is_monomial(right)):
+        return _poly_mul(left, right)
+    if isinstance(node.op, ast.Div) and len(right) == 1 and right[0] != 0:
+        return [c / right[0] for c in left]
+    return None
+
+
+@lru_cache(maxsize=64)
+def _horner_kernel(coeffs: tuple) -> Callable[[np.ndarray], np.ndarray]:
+    """Build a kernel evaluating the ascending coefficients by Horner's rule"""
+    lead = coeffs[-1]
+    lower = coeffs[-2::-1]
+    
+    def kernel(x_vals: np.ndarray) -> np.ndarray:
+        # One float64 temporary, updated in place: a multiply and an add per
+        # degree; single precision samples lose too much to the running sum
+        x64 = np.asarray(x_vals, dtype=np.float64)
+        y_vals = x64 * lead
+        for i, c in enumerate(lower):
+            if i:
+                y_vals *= x64
+            if c:
+                y_vals += c
+        return y_vals.astype(_result_dtype(np.asarray(x_vals)))
+    return kernel
+
+
+@dataclass(slots=True)
 class GraphState:
     """State management for the graph"""
     # Default scale adjusted to fit x: -25 to 25, y: -25 to 25
@@ -18,6 +156,8 @@ class GraphState:
     offset_y: float = 0.0
     expr: str = "x**2"
     expressions: List[str] = field(default_factory=list)  # Support multiple functions
+    # Insertion-ordered index of `expressions` for O(1) membership checks
+    expression_set: Dict[str, None] = field(default_factory=dict)
     show_minor_grid: bool = True
     dark_mode: bool = False  # Dark mode toggle
 
@@ -27,30 +167,86 @@ class FunctionGraph:
     
     @staticmethod
     def evaluate(expr: str, x_vals: np.ndarray) -> np.ndarray:
-        """Safely evaluate a mathematical expression"""
+        """Safely evaluate a mathematical expression
+        
+        The expression is first evaluated once over the whole array; only if
+        that fails (e.g. Python-level branching on x) is it sampled per point.
+        """
+        func = FunctionGraph.compile_expression(expr)
+        if func is None:
+            return np.full(len(x_vals), np.nan, dtype=_result_dtype(x_vals))
+        try:
+            with np.errstate(all="ignore"):
+                y_vals = np.asarray(func(x_vals), dtype=_result_dtype(x_vals))
+            # Constant expressions give a scalar; poles and domain errors give inf/nan
+            y_vals = np.broadcast_to(y_vals, x_vals.shape)
+            return np.where(np.isfinite(y_vals), y_vals, np.nan)
+        except NameError:
+            # Unknown names fail the same way at every point
+            return np.full(len(x_vals), np.nan, dtype=_result_dtype(x_vals))
+        except Exception:
+            pass
+        
         y_vals = []
         for x in x_vals:
             try:
-                y = eval(expr, {"x": x, "np": np, "__builtins__": {}})
+                y = func(x)
                 y_vals.append(y)
             except:
                 y_vals.append(float('nan'))
-        return np.array(y_vals)
+        return np.array(y_vals, dtype=_result_dtype(x_vals))
     
     @staticmethod
-    def create_path(x_vals: np.ndarray, y_vals: np.ndarray, 
-                   to_screen_func) -> List:
-        """Create path elements for drawing the curve"""
+    def compile_polynomial(expr: str) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+        """Return a Horner kernel if expr is a sum of monomials in x of degree 3 or more
+        
+        Kernels are shared by coefficient tuple. Degrees 0-2 return None: NumPy
+        already squares in one pass, while ``x**3`` and up take its slow
+        generic power path that Horner's rule avoids.
+        """
+        try:
+            coeffs = _poly_coeffs(ast.parse(expr, mode="eval").body)
+        except _PARSE_ERRORS:
+            return None
+        if coeffs is None:
+            return None
+        while len(coeffs) > 1 and coeffs[-1] == 0:
+            coeffs.pop()
+        if len(coeffs) < 4 or not all(np.isfinite(coeffs)):
+            return None
+        return _horner_kernel(tuple(coeffs))
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def compile_expression(expr: str) -> Optional[Callable]:
+        """Return the cached evaluator of expr as a function of x, or None if it does not parse
+        
+        Polynomials get a Horner kernel, everything else ``lambda x: <expr>``.
+        """
+        try:
+            return FunctionGraph.compile_polynomial(expr) or _lambdify(expr)
+        except _PARSE_ERRORS:
+            return None
+    
+    @staticmethod
+    def project(x_vals: np.ndarray, y_vals: np.ndarray, origin_x: float,
+                origin_y: float, scale: float) -> tuple:
+        """Map math coordinate arrays to screen coordinate arrays"""
+        return origin_x + x_vals * scale, origin_y - y_vals * scale
+    
+    @classmethod
+    def create_path_from_screen(cls, sxs: np.ndarray, sys_: np.ndarray,
+                                valid: np.ndarray) -> List:
+        """Create path elements from screen coordinates, breaking at invalid points"""
+        # Runs of valid samples start where the padded mask rises and end where it falls
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], valid, [False])).astype(np.int8)))
+        sxs = sxs.tolist()
+        sys_ = sys_.tolist()
         path_elements = []
-        first_valid = True
         
-        for i in range(len(x_vals)):
-            if not np.isnan(y_vals[i]):
-                sx, sy = to_screen_func(x_vals[i], y_vals[i])
-                if first_valid:
-                    path_elements.append(cv.Path.MoveTo(sx, sy))
-                    first_valid = False
-                else:
-                    path_elements.append(cv.Path.LineTo(sx, sy))
+        for start, end in zip(edges[::2].tolist(), edges[1::2].tolist()):
+            path_elements.append(cv.Path.MoveTo(sxs[start], sys_[start]))
+            path_elements += [cv.Path.LineTo(sx, sy)
+                              for sx, sy in zip(sxs[start + 1:end], sys_[start + 1:end])]
         
         return path_elements
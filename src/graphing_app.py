@@ -1,7 +1,53 @@
 """Main application class for Flet Algebra"""
 
+import asyncio
+import operator
+from dataclasses import dataclass
+from functools import partial
+
 import flet as ft
+import numpy as np
 from coordinate_system import CoordinateSystem
+from graph_state import FunctionGraph
+
+# Shared style kwargs for the builders below
+_BOLD = ft.FontWeight.BOLD
+_BOTTOM_WHITE = dict(icon_color=ft.Colors.WHITE)
+
+# Function rows mounted in the ListView at once; the rest stay off the tree
+_ROW_WINDOW_SIZE = 20
+# Fixed row height so the ListView can lay out rows without measuring them
+_ROW_EXTENT = 56
+_ROW_SPACING = 10
+
+# Expressions pre-compiled at startup so the first edit hits a warm cache
+_WARM_EXPRESSIONS = ("x**2", "sin(x)", "cos(x)", "exp(x)", "x**3 - 2*x")
+
+# CoordinateSystem view actions reachable from buttons, see GraphingApp._do
+_HANDLERS = {
+    name: operator.methodcaller(name)
+    for name in (
+        "pan_left", "pan_right", "pan_up", "pan_down",
+        "zoom_in", "zoom_out", "reset_view",
+    )
+}
+
+# Trailing delay (seconds) used to coalesce a burst of keystrokes into one redraw
+_EXPR_DEBOUNCE_DELAY = 0.15
+
+
+@dataclass(eq=False)
+class FunctionRow:
+    """Controls belonging to one function input row
+    
+    Compared by identity: the controls point back to this object through
+    their ``data`` field, and Flet controls compare by value, so a field-wise
+    ``__eq__`` would recurse forever.
+    """
+    text_field: ft.TextField
+    submit_item: ft.PopupMenuItem
+    row_menu: ft.PopupMenuButton
+    item_row: ft.Row
 
 
 class GraphingApp:
@@ -15,6 +61,29 @@ class GraphingApp:
         self.bottom_appbar_ref = ft.Ref[ft.BottomAppBar]()
         self.functions_list_ref = ft.Ref[ft.ListView]()
         self.drawer = None  # Store drawer reference
+        self._main_content: ft.Row | None = None  # Set once build_ui has run
+        # Pending debounced expression update
+        self._pending_timer: asyncio.TimerHandle | None = None
+        # Controls mutated by the current event, flushed in one page.update().
+        # Keyed by id() because Flet controls compare equal by value.
+        self._dirty: dict[int, ft.Control] = {}
+        # Submit/Remove menus returned by removed function rows, ready for reuse
+        self._row_menu_pool: list[ft.PopupMenuButton] = []
+        # Every function row; only a sliding window of them is in the ListView
+        self._all_rows: list[ft.Row] = []
+        self._row_window_start = 0
+        self._cs: CoordinateSystem | None = None  # Set in _create_controls_stack
+    
+    def _mark_dirty(self, ctrl: ft.Control):
+        """Queue a mutated control for the next flush"""
+        self._dirty[id(ctrl)] = ctrl
+    
+    def _flush(self):
+        """Send one update containing only the controls marked dirty"""
+        if self._dirty:
+            controls = list(self._dirty.values())
+            self._dirty.clear()
+            self.page.update(*controls)
     
     def setup_page(self):
         """Configure page properties"""
@@ -23,36 +92,49 @@ class GraphingApp:
         self.page.window.height = 800
         self.page.padding = 0
         self.page.bgcolor = ft.Colors.WHITE
+        
+        # Pre-build common kernels while the client handshake is still running
+        # (run_thread falls back to an inline call where threads are unavailable)
+        self.page.run_thread(self._warm_kernels)
+    
+    def _warm_kernels(self):
+        """Compile and run the common expression templates once"""
+        x_vals = np.linspace(-1, 1, 8)
+        for expr in _WARM_EXPRESSIONS:
+            FunctionGraph.evaluate(expr, x_vals)
     
     def build_ui(self):
-        """Build the complete UI"""
+        """Build the complete UI (repeated calls keep the mounted controls)"""
+        if self._main_content is not None:
+            return
         self.setup_page()
         
-        # Create drawer first and set it on page BEFORE creating appbar
-        self.drawer = self._create_drawer()
-        self.page.drawer = self.drawer  # Use page.drawer, not navigation_drawer
-        
-        # Then create appbar and bottomappbar
-        appbar = self._create_top_bar()
-        main_content = self._create_controls_stack()
-        bottom_appbar = self._create_bottom_appbar()
+        # Bars and content left on the page by another GraphingApp (e.g. before
+        # a hot reload) are bound to that app's state, so they are replaced.
+        # Drawer and bottom app bar start hidden, so they are built lazily on
+        # first open (see on_menu_click / on_coordinate_long_press)
+        self.page.appbar = self._create_top_bar()
+        self.page.drawer = None
+        self.page.bottom_appbar = None
+        self._main_content = self._create_controls_stack()
         
-        self.page.appbar = appbar
-        self.page.bottom_appbar = bottom_appbar
-        self.page.add(main_content)
+        self.page.controls = [self._main_content]
+        self.page.update()
     
     def _create_drawer(self):
         """Create navigation drawer"""
+        # Stays async: close_drawer() is only exposed as a coroutine. The panel
+        # patch is sent without awaiting, so the close call is the only hop.
         async def handle_drawer_change(e: ft.NavigationDrawer):
             """Handle drawer item selection"""
             selected = e.control.selected_index
             # Show controls panel when Functions (index 0) is selected
             if selected == 0 and self.control_panel_ref.current:
                 self.control_panel_ref.current.visible = True
-                self.page.update()
+                self.control_panel_ref.current.update()
             await self.page.close_drawer()
         
-        async def handle_drawer_dismiss(e):
+        def handle_drawer_dismiss(e):
             """Handle drawer dismissal"""
             print("Drawer dismissed!")
         
@@ -92,13 +174,15 @@ class GraphingApp:
     
     def _create_top_bar(self):
         """Create top app bar with popup menu for grid and reset"""
-        async def on_menu_click(e):
+        async def on_menu_click(e):  # show_drawer() is coroutine-only
+            if self.drawer is None:
+                # Use page.drawer, not navigation_drawer
+                self.drawer = self._create_drawer()
+                self.page.drawer = self.drawer
+                self._mark_dirty(self.page)
+                self._flush()
             await self.page.show_drawer()
         
-        def on_reset_click(e):
-            """Reset view from menu"""
-            self._reset_view()
-        
         # Create grid toggle menu item with indicator
         # Store the checkmark icon reference so we can update its visibility
         checkmark_icon = ft.Icon(
@@ -113,9 +197,12 @@ class GraphingApp:
             if self.coordinate_system_ref.current:
                 current_state = self.coordinate_system_ref.current.state.show_minor_grid
                 self.coordinate_system_ref.current.state.show_minor_grid = not current_state
-                checkmark_icon.visible = not current_state  # Update checkmark visibility
+                # redraw() pushes its own canvas update
                 self.coordinate_system_ref.current.redraw()
-                self.page.update()
+                # Update checkmark visibility only if it is out of sync with the state
+                if checkmark_icon.visible != (not current_state):
+                    checkmark_icon.visible = not current_state
+                    checkmark_icon.update()
         
         # Dark mode toggle
         dark_mode_checkmark = ft.Icon(
@@ -139,7 +226,9 @@ class GraphingApp:
                     self.page.bgcolor = ft.Colors.WHITE
                 
                 self.coordinate_system_ref.current.redraw()
-                self.page.update()
+                self._mark_dirty(dark_mode_checkmark)
+                self._mark_dirty(self.page)
+                self._flush()
         
         grid_menu_item = ft.PopupMenuItem(
             content=ft.Row(
@@ -166,7 +255,7 @@ class GraphingApp:
         )
         
         return ft.AppBar(
-            title=ft.Text("Graphing Calculator", weight=ft.FontWeight.BOLD),
+            title=ft.Text("Graphing Calculator", weight=_BOLD),
             center_title=False,
             leading=ft.IconButton(
                 ft.Icons.MENU,
@@ -181,7 +270,7 @@ class GraphingApp:
                         ft.PopupMenuItem(
                             content="Reset View",
                             icon=ft.Icons.REFRESH,
-                            on_click=on_reset_click,
+                            on_click=partial(self._do, "reset_view"),
                         ),
                     ]
                 ),
@@ -192,52 +281,55 @@ class GraphingApp:
     
     def _create_bottom_appbar(self):
         """Create bottom app bar with pan and zoom buttons (initially invisible)"""
+        # Local aliases: one LOAD_FAST per use instead of an attribute chain
+        Icons, Colors, IB = ft.Icons, ft.Colors, ft.IconButton
+        
         def on_close_bottom_appbar(e):
             if self.bottom_appbar_ref.current:
                 self.bottom_appbar_ref.current.visible = False
-                self.page.update()
+                self.bottom_appbar_ref.current.update()
         
         return ft.BottomAppBar(
             ref=self.bottom_appbar_ref,
-            bgcolor=ft.Colors.BLUE_600,
+            bgcolor=Colors.BLUE_600,
             visible=False,  # Initially invisible
             content=ft.Row(
                 alignment=ft.MainAxisAlignment.SPACE_AROUND,
                 controls=[
-                    ft.IconButton(
-                        ft.Icons.ARROW_BACK,
-                        icon_color=ft.Colors.WHITE,
-                        on_click=lambda e: self._pan_left(),
+                    IB(
+                        Icons.ARROW_BACK,
+                        on_click=partial(self._do, "pan_left"),
+                        **_BOTTOM_WHITE,
                     ),
-                    ft.IconButton(
-                        ft.Icons.ARROW_UPWARD,
-                        icon_color=ft.Colors.WHITE,
-                        on_click=lambda e: self._pan_up(),
+                    IB(
+                        Icons.ARROW_UPWARD,
+                        on_click=partial(self._do, "pan_up"),
+                        **_BOTTOM_WHITE,
                     ),
-                    ft.IconButton(
-                        ft.Icons.ARROW_DOWNWARD,
-                        icon_color=ft.Colors.WHITE,
-                        on_click=lambda e: self._pan_down(),
+                    IB(
+                        Icons.ARROW_DOWNWARD,
+                        on_click=partial(self._do, "pan_down"),
+                        **_BOTTOM_WHITE,
                     ),
-                    ft.IconButton(
-                        ft.Icons.ARROW_FORWARD,
-                        icon_color=ft.Colors.WHITE,
-                        on_click=lambda e: self._pan_right(),
+                    IB(
+                        Icons.ARROW_FORWARD,
+                        on_click=partial(self._do, "pan_right"),
+                        **_BOTTOM_WHITE,
                     ),
-                    ft.IconButton(
-                        ft.Icons.ADD,
-                        icon_color=ft.Colors.WHITE,
-                        on_click=lambda e: self._zoom_in(),
+                    IB(
+                        Icons.ADD,
+                        on_click=partial(self._do, "zoom_in"),
+                        **_BOTTOM_WHITE,
                     ),
-                    ft.IconButton(
-                        ft.Icons.REMOVE,
-                        icon_color=ft.Colors.WHITE,
-                        on_click=lambda e: self._zoom_out(),
+                    IB(
+                        Icons.REMOVE,
+                        on_click=partial(self._do, "zoom_out"),
+                        **_BOTTOM_WHITE,
                     ),
-                    ft.IconButton(
-                        ft.Icons.CLOSE,
-                        icon_color=ft.Colors.WHITE,
+                    IB(
+                        Icons.CLOSE,
                         on_click=on_close_bottom_appbar,
+                        **_BOTTOM_WHITE,
                     ),
                 ],
             ),
@@ -245,9 +337,14 @@ class GraphingApp:
     
     def _create_controls_stack(self):
         """Create the main content stack"""
+        # Local aliases: one LOAD_FAST per use instead of an attribute chain
+        Icons, Colors, IB = ft.Icons, ft.Colors, ft.IconButton
+        
         # Create coordinate system
         coord_system = CoordinateSystem(self.page)
         self.coordinate_system_ref.current = coord_system
+        # Direct handle for the pan/zoom handlers (avoids the Ref lookup per click)
+        self._cs = coord_system
         
         # Create expression input with ListView for multiple functions
         expr_field = ft.TextField(
@@ -258,149 +355,29 @@ class GraphingApp:
             on_change=self._on_expr_change,
         )
         
-        def create_function_item(expr_text: str = ""):
-            """Create a function input row with PopupMenuButton for +/- actions"""
-            text_field = ft.TextField(
-                label="f(x) = ",
-                value=expr_text,
-                width=180,
-            )
-            
-            # Create the row first so we can reference it in the remove function
-            item_row = None
-            
-            def on_apply_function(e):
-                expr = text_field.value
-                if expr and self.coordinate_system_ref.current:
-                    # Add to expressions list
-                    if expr not in self.coordinate_system_ref.current.state.expressions:
-                        self.coordinate_system_ref.current.state.expressions.append(expr)
-                    self.coordinate_system_ref.current.redraw()
-            
-            def on_remove_function(e):
-                expr = text_field.value
-                # Remove from expressions list
-                if expr and self.coordinate_system_ref.current:
-                    if expr in self.coordinate_system_ref.current.state.expressions:
-                        self.coordinate_system_ref.current.state.expressions.remove(expr)
-                    self.coordinate_system_ref.current.redraw()
-                
-                # Remove from ListView
-                if item_row and self.functions_list_ref.current:
-                    if item_row in self.functions_list_ref.current.controls:
-                        self.functions_list_ref.current.controls.remove(item_row)
-                        self.page.update()
-            
-            def on_text_change(e):
-                """Enable/disable submit button based on text input"""
-                self.page.update()
-            
-            # Set on_submit to call same function as the button
-            text_field.on_submit = on_apply_function
-            text_field.on_change = on_text_change
-            
-            item_row = ft.Row(
-                controls=[
-                    text_field,
-                    ft.PopupMenuButton(
-                        items=[
-                            ft.PopupMenuItem(
-                                content=ft.Row(
-                                    controls=[
-                                        ft.Icon(ft.Icons.ADD, size=16),
-                                        ft.Text("Submit"),
-                                    ],
-                                    spacing=5,
-                                ),
-                                on_click=on_apply_function,
-                            ),
-                            ft.PopupMenuItem(
-                                content=ft.Row(
-                                    controls=[
-                                        ft.Icon(ft.Icons.REMOVE, size=16),
-                                        ft.Text("Remove"),
-                                    ],
-                                    spacing=5,
-                                ),
-                                on_click=on_remove_function,
-                            ),
-                        ],
-                    ),
-                ],
-                spacing=5,
-            )
-            
-            return item_row
-        
         def on_add_function(e):
             """Add a new function input field"""
             if self.functions_list_ref.current:
-                self.functions_list_ref.current.controls.append(create_function_item())
-                self.page.update()
+                self._all_rows.append(self._make_function_item())
+                # Slide the window to the end so the new row is shown
+                self._row_window_start = len(self._all_rows)
+                self._sync_row_window()
         
         def on_close_click(e):
             if self.control_panel_ref.current:
                 self.control_panel_ref.current.visible = False
-                self.page.update()
-        
-        def on_grid_toggle(e):
-            if self.coordinate_system_ref.current:
-                new_value = e.control.value
-                self.coordinate_system_ref.current.state.show_minor_grid = new_value
-                self.coordinate_system_ref.current.redraw()
-                self.page.update()
+                self.control_panel_ref.current.update()
         
         # Create ListView for multiple functions
         functions_list = ft.ListView(
             ref=self.functions_list_ref,
             controls=[],
-            spacing=10,
+            spacing=_ROW_SPACING,
             padding=10,
-            height=self.page.height,
-        )
-        
-        # Create control buttons
-        pan_left_btn = ft.FloatingActionButton(
-            icon=ft.Icons.ARROW_BACK,
-            on_click=lambda e: self._pan_left(),
-            bgcolor=ft.Colors.BLUE_400,
-            mini=True,
-        )
-        pan_right_btn = ft.FloatingActionButton(
-            icon=ft.Icons.ARROW_FORWARD,
-            on_click=lambda e: self._pan_right(),
-            bgcolor=ft.Colors.BLUE_400,
-            mini=True,
-        )
-        pan_up_btn = ft.FloatingActionButton(
-            icon=ft.Icons.ARROW_UPWARD,
-            on_click=lambda e: self._pan_up(),
-            bgcolor=ft.Colors.BLUE_400,
-            mini=True,
-        )
-        pan_down_btn = ft.FloatingActionButton(
-            icon=ft.Icons.ARROW_DOWNWARD,
-            on_click=lambda e: self._pan_down(),
-            bgcolor=ft.Colors.BLUE_400,
-            mini=True,
-        )
-        zoom_in_btn = ft.FloatingActionButton(
-            icon=ft.Icons.ADD,
-            on_click=lambda e: self._zoom_in(),
-            bgcolor=ft.Colors.GREEN_400,
-            mini=True,
-        )
-        zoom_out_btn = ft.FloatingActionButton(
-            icon=ft.Icons.REMOVE,
-            on_click=lambda e: self._zoom_out(),
-            bgcolor=ft.Colors.GREEN_400,
-            mini=True,
-        )
-        reset_btn = ft.FloatingActionButton(
-            icon=ft.Icons.REFRESH,
-            on_click=lambda e: self._reset_view(),
-            bgcolor=ft.Colors.ORANGE_400,
-            mini=True,
+            # Fill the control panel column instead of pinning a build-time height
+            expand=True,
+            item_extent=_ROW_EXTENT,
+            on_scroll=self._on_list_scroll,
         )
         
         # Create control panel (initially invisible) with ListView for functions
@@ -410,10 +387,10 @@ class GraphingApp:
                 controls=[
                     ft.Row(
                         controls=[
-                            ft.Text("Functions", weight=ft.FontWeight.BOLD),
+                            ft.Text("Functions", weight=_BOLD),
                             ft.Container(expand=True),
-                            ft.IconButton(
-                                ft.Icons.CLOSE,
+                            IB(
+                                Icons.CLOSE,
                                 on_click=on_close_click,
                                 icon_size=20,
                             ),
@@ -424,7 +401,7 @@ class GraphingApp:
 
                     ft.Button(
                         "Add Function",
-                        icon=ft.Icons.ADD,
+                        icon=Icons.ADD,
                         on_click=on_add_function,
                         width=230,
                     ),
@@ -434,7 +411,7 @@ class GraphingApp:
                 spacing=5,
             ),
             padding=15,
-            bgcolor=ft.Colors.GREY_100,
+            bgcolor=Colors.GREY_100,
             border_radius=10,
             width=250,
             visible=False,  # Initially invisible
@@ -442,10 +419,13 @@ class GraphingApp:
         
         # Create main stack with left control panel and right coordinate system
         def on_coordinate_long_press(e):
-            """Show bottom app bar on long press"""
-            if self.bottom_appbar_ref.current:
-                self.bottom_appbar_ref.current.visible = True
-                self.page.update()
+            """Show bottom app bar on long press (built on first use)"""
+            if self.bottom_appbar_ref.current is None:
+                self.page.bottom_appbar = self._create_bottom_appbar()
+                self._mark_dirty(self.page)
+            self.bottom_appbar_ref.current.visible = True
+            self._mark_dirty(self.bottom_appbar_ref.current)
+            self._flush()
         
         # Wrap coordinate system with gesture detector for long-press only
         # The coordinate system itself handles pan/zoom events
@@ -478,37 +458,140 @@ class GraphingApp:
         
         return main_content
     
-    def _on_expr_change(self, e):
-        """Handle expression change"""
-        expr = self.expr_field_ref.current.value
-        if expr:
-            if self.coordinate_system_ref.current:
-                self.coordinate_system_ref.current.set_expression(expr)
+    def _make_function_item(self, expr_text: str = "") -> ft.Row:
+        """Create a function input row with PopupMenuButton for +/- actions"""
+        text_field = ft.TextField(
+            label="f(x) = ",
+            value=expr_text,
+            width=180,
+            # Set on_submit to call same function as the button
+            on_submit=self._on_apply_function,
+            on_change=self._on_function_text_change,
+        )
+        
+        # Reuse a pooled Submit/Remove menu when one is available
+        if self._row_menu_pool:
+            row_menu = self._row_menu_pool.pop()
+            submit_item, remove_item = row_menu.items
+        else:
+            submit_item = ft.PopupMenuItem(
+                content=ft.Row(
+                    controls=[
+                        ft.Icon(ft.Icons.ADD, size=16),
+                        ft.Text("Submit"),
+                    ],
+                    spacing=5,
+                ),
+                on_click=self._on_apply_function,
+            )
+            remove_item = ft.PopupMenuItem(
+                content=ft.Row(
+                    controls=[
+                        ft.Icon(ft.Icons.REMOVE, size=16),
+                        ft.Text("Remove"),
+                    ],
+                    spacing=5,
+                ),
+                on_click=self._on_remove_function,
+            )
+            row_menu = ft.PopupMenuButton(items=[submit_item, remove_item])
+        submit_item.disabled = not expr_text
+        
+        item_row = ft.Row(
+            controls=[
+                text_field,
+                row_menu,
+            ],
+            spacing=5,
+        )
+        
+        # Handlers find their row through e.control.data
+        row = FunctionRow(text_field, submit_item, row_menu, item_row)
+        text_field.data = submit_item.data = remove_item.data = row
+        return item_row
     
-    def _pan_left(self):
-        if self.coordinate_system_ref.current:
-            self.coordinate_system_ref.current.pan_left()
+    def _on_apply_function(self, e):
+        row: FunctionRow = e.control.data
+        expr = row.text_field.value
+        if expr and self.coordinate_system_ref.current:
+            # Add to expressions list (the redraw compiles its kernel)
+            state = self.coordinate_system_ref.current.state
+            if expr not in state.expression_set:
+                state.expression_set[expr] = None
+                state.expressions.append(expr)
+            self.coordinate_system_ref.current.redraw()
     
-    def _pan_right(self):
-        if self.coordinate_system_ref.current:
-            self.coordinate_system_ref.current.pan_right()
+    def _on_remove_function(self, e):
+        row: FunctionRow = e.control.data
+        expr = row.text_field.value
+        # Remove from expressions list
+        if expr and self.coordinate_system_ref.current:
+            state = self.coordinate_system_ref.current.state
+            if expr in state.expression_set:
+                del state.expression_set[expr]
+                state.expressions = list(state.expression_set)
+            self.coordinate_system_ref.current.redraw()
+        
+        # Remove from ListView
+        if self.functions_list_ref.current:
+            if row.item_row in self._all_rows:
+                self._all_rows.remove(row.item_row)
+                self._sync_row_window()
+                # Detach the menu and keep it for the next added row
+                row.item_row.controls.remove(row.row_menu)
+                self._row_menu_pool.append(row.row_menu)
+    
+    def _sync_row_window(self):
+        """Mount the current window of function rows in the ListView"""
+        max_start = max(len(self._all_rows) - _ROW_WINDOW_SIZE, 0)
+        self._row_window_start = min(self._row_window_start, max_start)
+        start = self._row_window_start
+        self.functions_list_ref.current.controls = self._all_rows[start:start + _ROW_WINDOW_SIZE]
+        self.functions_list_ref.current.update()
     
-    def _pan_up(self):
-        if self.coordinate_system_ref.current:
-            self.coordinate_system_ref.current.pan_up()
+    async def _on_list_scroll(self, e: ft.OnScrollEvent):
+        """Slide the row window when scrolling reaches either end of it"""
+        start = self._row_window_start
+        step = _ROW_WINDOW_SIZE // 2
+        if e.pixels >= e.max_scroll_extent and start + _ROW_WINDOW_SIZE < len(self._all_rows):
+            shift = min(step, len(self._all_rows) - _ROW_WINDOW_SIZE - start)
+        elif e.pixels <= e.min_scroll_extent and start > 0:
+            shift = -min(step, start)
+        else:
+            return
+        self._row_window_start = start + shift
+        self._sync_row_window()
+        # Scroll back by the rows that moved so the visible rows stay in place
+        await e.control.scroll_to(delta=-shift * (_ROW_EXTENT + _ROW_SPACING))
     
-    def _pan_down(self):
-        if self.coordinate_system_ref.current:
-            self.coordinate_system_ref.current.pan_down()
+    def _on_function_text_change(self, e):
+        """Enable/disable submit button based on text input"""
+        row: FunctionRow = e.control.data
+        disabled = not row.text_field.value
+        # Only push an update when the enabled state actually flips
+        if row.submit_item.disabled == disabled:
+            return
+        row.submit_item.disabled = disabled
+        row.submit_item.update()
     
-    def _zoom_in(self):
-        if self.coordinate_system_ref.current:
-            self.coordinate_system_ref.current.zoom_in()
+    def _on_expr_change(self, e):
+        """Handle expression change - debounced so a typing burst redraws once"""
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+        self._pending_timer = self.page.loop.call_later(
+            _EXPR_DEBOUNCE_DELAY, self._flush_expr
+        )
     
-    def _zoom_out(self):
-        if self.coordinate_system_ref.current:
-            self.coordinate_system_ref.current.zoom_out()
+    def _flush_expr(self):
+        """Apply the latest expression text once typing has settled"""
+        self._pending_timer = None
+        if not self.expr_field_ref.current:
+            return
+        expr = self.expr_field_ref.current.value
+        if expr:
+            if self.coordinate_system_ref.current:
+                self.coordinate_system_ref.current.set_expression(expr)
     
-    def _reset_view(self):
-        if self.coordinate_system_ref.current:
-            self.coordinate_system_ref.current.reset_view()
+    def _do(self, verb: str, e=None):
+        """Run a pan/zoom/reset action on the coordinate system"""
+        _HANDLERS[verb](self._cs)
@@ -0,0 +1,45 @@
+"""Tests for the function curve drawing in CoordinateSystem"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from coordinate_system import CoordinateSystem  # noqa: E402
+
+
+def _make_coordinate_system() -> CoordinateSystem:
+    """Create a CoordinateSystem on a stand-in 1200x800 page"""
+    page = mock.MagicMock()
+    page.width = page.window.width = 1200
+    page.height = page.window.height = 800
+    return CoordinateSystem(page)
+
+
+class DrawFunctionTest(unittest.TestCase):
+    """Curves are clipped to the visible y range without losing segments"""
+    
+    def _curve_elements(self, expr: str) -> list:
+        cs = _make_coordinate_system()
+        cs.state.expressions = [expr]
+        shapes = cs._build_function_shapes(1200, 800, (600, 400), 600)
+        return shapes[0].elements if shapes else []
+    
+    def test_steep_line_crossing_the_view_is_drawn(self):
+        # Consecutive samples of 1000*x land far below and far above the view
+        elements = self._curve_elements("1000*x")
+        self.assertGreaterEqual(len(elements), 2)
+        ys = [element.y for element in elements]
+        self.assertGreater(max(ys), 800)
+        self.assertLess(min(ys), 0)
+    
+    def test_samples_far_outside_the_view_are_dropped(self):
+        elements = self._curve_elements("x**2")
+        self.assertGreater(len(elements), 0)
+        self.assertLess(len(elements), 600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+"""Tests for expression evaluation in graph_state"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from graph_state import FunctionGraph  # noqa: E402
+
+# Single precision samples over the default view, as CoordinateSystem draws them
+_X_VALS = np.linspace(-50, 50, 600, dtype=np.float32)
+
+
+class EvaluatePolynomialTest(unittest.TestCase):
+    """Polynomial expressions match direct double precision evaluation"""
+    
+    def _assert_matches_direct(self, expr: str):
+        y_vals = FunctionGraph.evaluate(expr, _X_VALS)
+        expected = eval(expr, {"x": _X_VALS.astype(np.float64)})
+        np.testing.assert_allclose(y_vals, expected, rtol=1e-5, atol=1e-3, err_msg=expr)
+    
+    def test_shifted_powers(self):
+        for expr in ("(x-5)**10", "(x+4)**9", "(x-20)**8", "(x+1)**5/7"):
+            self._assert_matches_direct(expr)
+    
+    def test_sums_of_monomials(self):
+        for expr in ("x**3 - 2*x", "3*x**4 + 2*x**3 - x + 1", "x*(x**2 - 2)"):
+            self.assertIsNotNone(FunctionGraph.compile_polynomial(expr))
+            self._assert_matches_direct(expr)
+
+
+if __name__ == "__main__":
+    unittest.main()